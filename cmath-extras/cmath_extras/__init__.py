@@ -1 +1,6 @@
-from .cmath_extras import *
\ No newline at end of file
+from .cmath_extras import *
+
+try:
+    from ._fast import cnum_polar_deg, cnum_polar_rad
+except ImportError: # The compiled functions are only available when Numba is installed.
+    pass
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+This module contains Numba-compiled versions of the polar branch of cnum() for use in tight loops.
+
+The functions are only made available by the package when Numba is installed. Unlike cnum(), they do not validate their arguments: 
+both the magnitude and the angle must be of type 'int' or 'float'.
+
+The results only approximately match cnum(): the exact values cnum() uses for common angles are not looked up 
+(cnum_polar_deg(10, 180) is about -10+1.2e-15j where cnum(10, 180) is exactly -10+0j), and the functions are compiled 
+with fastmath=True, which allows the compiler to reorder floating-point operations and to assume that no NaN or infinite 
+values occur. Such values are therefore not guaranteed to propagate as they do in cnum().
+"""
+
+import math
+
+from numba import njit
+
+_DEG2RAD = math.pi/180 # Conversion factor from degrees to radians, frozen as a constant by Numba.
+
+@njit(cache=True, fastmath=True)
+def cnum_polar_deg(r:float, theta:float) -> complex:
+    """Returns the complex number defined by the magnitude `r` and the angle `theta` in degrees.
+
+    Examples
+    --------
+    >>> cnum = cnum_polar_deg(10, 180) # Approximately cnum(10, 180), but compiled with Numba.
+    """
+
+    return r*(math.cos(theta*_DEG2RAD) + 1j*math.sin(theta*_DEG2RAD))
+
+
+@njit(cache=True, fastmath=True)
+def cnum_polar_rad(r:float, theta:float) -> complex:
+    """Returns the complex number defined by the magnitude `r` and the angle `theta` in radians.
+
+    Examples
+    --------
+    >>> cnum = cnum_polar_rad(10, 3.14) # Approximately cnum(10, 3.14, 'rad'), but compiled with Numba.
+    """
+
+    return r*(math.cos(theta) + 1j*math.sin(theta))
@@ -2,8 +2,87 @@
 This module contains functions that make it easier to work with complex numbers in Python.
 """
 
-from math import e, pi
-from cmath import phase
+import sys as _sys
+from math import atan2 as _atan2, hypot as _hypot, isfinite as _isfinite, pi, remainder as _remainder, sqrt as _sqrt
+from cmath import phase, rect as _rect
+
+_DEG2RAD = pi/180 # Conversion factor from degrees to radians.
+_RAD2DEG = 180/pi # Conversion factor from radians to degrees.
+
+_ANGLE_SIGN = '\u2220' # The angle sign used in polar angle notation.
+_DEG_SIGN = '\u00b0' # The degree sign.
+_POL_FMT = '%.*f' + _ANGLE_SIGN + '%.*f' + _DEG_SIGN # The polar angle notation, with the number of decimals passed as an argument.
+
+# Factors converting an angle in the given unit to radians.
+_UNIT_SCALE = {
+    'deg': _DEG2RAD, 'Deg': _DEG2RAD, 'DEG': _DEG2RAD,
+    'rad': 1.0, 'Rad': 1.0, 'RAD': 1.0,
+}
+
+# Exact unit phasors for the most common angles (in degrees), so that no trigonometric functions 
+# have to be evaluated for them and no rounding errors like sin(pi) != 0 are introduced.
+_EXACT_DEG = {
+    0.0: complex(1, 0),
+    30.0: complex(_sqrt(3)/2, 1/2),
+    45.0: complex(_sqrt(2)/2, _sqrt(2)/2),
+    60.0: complex(1/2, _sqrt(3)/2),
+    90.0: complex(0, 1),
+    120.0: complex(-1/2, _sqrt(3)/2),
+    135.0: complex(-_sqrt(2)/2, _sqrt(2)/2),
+    150.0: complex(-_sqrt(3)/2, 1/2),
+    180.0: complex(-1, 0),
+    210.0: complex(-_sqrt(3)/2, -1/2),
+    225.0: complex(-_sqrt(2)/2, -_sqrt(2)/2),
+    240.0: complex(-1/2, -_sqrt(3)/2),
+    270.0: complex(0, -1),
+    300.0: complex(1/2, -_sqrt(3)/2),
+    315.0: complex(_sqrt(2)/2, -_sqrt(2)/2),
+    330.0: complex(_sqrt(3)/2, -1/2),
+}
+
+
+def _unit_scale(unit:str) -> float:
+    """Returns the factor converting an angle in `unit` to radians."""
+
+    scale = _UNIT_SCALE.get(unit)
+    if scale is None:
+        # Unusual spellings like 'dEg' are only lowered when the direct lookup fails.
+        scale = _UNIT_SCALE.get(unit.lower())
+        if scale is None:
+            raise ValueError("The angle unit must be defined with either 'deg' or 'rad'.")
+    return scale
+
+
+def _polar_parts(r:int|float, theta:int|float, unit:str) -> tuple[float, float]:
+    """Returns the magnitude and angle in degrees of the position vector with the magnitude `r` and the angle `theta` in `unit`.
+
+    The angle is normalized to the interval [-180, 180], where -180 is only returned for angles that reach the negative real axis clockwise (like atan2() does for a negative zero imaginary part). 
+    A negative magnitude is turned into a positive one by rotating the angle half a turn, and a zero magnitude always has the angle 0. 
+    Raises a ValueError if the angle is infinite or NaN.
+    """
+
+    ang = theta if _unit_scale(unit) == _DEG2RAD else theta*_RAD2DEG # Angle in degrees.
+    if not _isfinite(ang):
+        raise ValueError("The angle must be a finite number.")
+    if r == 0:
+        # The zero vector has no direction, so it is shown like a Cartesian zero.
+        return 0.0, 0.0
+    # The angle is reduced with remainder(), which is exact, before the half turn for a negative magnitude is added.
+    half_turn = 180 if r < 0 else 0
+    norm = _remainder(_remainder(ang, 360) + half_turn, 360)
+    if abs(norm) == 180:
+        norm = -180.0 if ang + half_turn < 0 else 180.0
+    return abs(r), norm
+
+
+def _check_dec(dec:int):
+    """Raises an error if `dec` is not a valid number of decimals."""
+
+    if type(dec) is not int:
+        raise TypeError("The number of decimals must be of type 'int'.")
+    if dec < 0:
+        raise ValueError("The number of decimals must be defined with a positive integer.")
+
 
 def cnum(a:int|float|complex, b:int|float|complex=None, unit:str='deg') -> complex:
     """Returns a complex number which can be used in further calculations.
@@ -49,23 +128,119 @@ def cnum(a:int|float|complex, b:int|float|complex=None, unit:str='deg') -> compl
             return complex(a)
         else:
             raise TypeError("The polynomial must be of type 'int', 'float' or 'complex'.")
+    elif not isinstance(a, (int, float)):
+        raise TypeError("The first argument must be of type 'int' or 'float'.")
+    elif isinstance(b, complex):
+        # The complex number is entered as Cartesian coordinates.
+        return complex(a+b)
+    elif isinstance(b, (int, float)):
+        # The complex number is entered as a position vector in the polar complex plane.
+        scale = _unit_scale(unit)
+        if not _isfinite(b):
+            # cmath.rect() can not rotate a vector by an infinite angle, and a NaN angle has no direction.
+            raise ValueError("The angle must be a finite number.")
+        return polar_deg(a, b) if scale == _DEG2RAD else polar_rad(a, b)
     else:
-        if isinstance(a, (int, float)):
-            if isinstance(b, complex):
-                # The complex number is entered as Cartesian coordinates.
-                return complex(a+b)
-            elif isinstance(b, (int, float)):
-                # The complex number is entered as a position vector in the polar complex plane.
-                if unit.lower() == 'deg': 
-                    return a*e**(b*(pi/180)*1j)
-                elif unit.lower() == 'rad': 
-                    return a*e**(b*1j)
-                else: 
-                    raise ValueError("The angle unit must be defined with either 'deg' or 'rad'.")
-            else:
-                raise TypeError("The second argument must be of type 'int', 'float' or 'complex'.") 
-        else:
-            raise TypeError("The first argument must be of type 'int' or 'float'.")
+        raise TypeError("The second argument must be of type 'int', 'float' or 'complex'.")
+
+
+def cnum_array(r, theta, unit:str='deg'):
+    """Returns an array of complex numbers defined by the magnitudes `r` and the angles `theta`.
+
+    This is the vectorized counterpart of entering complex numbers as position vectors in the polar complex plane with cnum(), meant for batches of phasors such as frequency sweeps. It requires NumPy.
+
+    Unlike cnum(), the angles are always evaluated with trigonometric functions, even the common angles that cnum() looks up exactly. The results can therefore differ from cnum() by rounding errors, e.g. cnum_array([1], [180]) has an imaginary part of about 1.2e-16 where cnum(1, 180) has exactly 0.
+
+    When entering the angles, the angle unit is degrees by default. This can be changed to radians by passing 'rad' to `unit`.
+
+    Parameters
+    ----------
+    `r` : array_like
+        * The magnitudes/moduli of the complex numbers.
+
+    `theta` : array_like
+        * The angles/arguments of the complex numbers. Must be broadcastable against `r`.
+
+    `unit` : {'deg', 'rad'}, optional
+        * The angle unit (degrees or radians) of `theta` (default is 'deg').
+
+    Returns
+    -------
+    numpy.ndarray
+        * The complex numbers as an array of dtype complex128.
+
+    Examples
+    --------
+    >>> arr = cnum_array([10, 10, 10], [0, 90, 180]) # The angles are entered in degrees.
+    >>> arr = cnum_array(10, numpy.linspace(0, 3.14, 100), 'rad') # The angles are entered in radians.
+    """
+
+    # NumPy is imported here rather than at module level, so that importing the package does not require or load it.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("cnum_array() requires NumPy to be installed.") from None
+
+    # DEFINE AND RETURN THE COMPLEX NUMBERS:
+    theta = np.asarray(theta, dtype=float)*_unit_scale(unit) # Angles in radians.
+    return np.asarray(r, dtype=float)*np.exp(1j*theta)
+
+
+def polar_deg(r:int|float, theta:int|float) -> complex:
+    """Returns the complex number defined by the magnitude `r` and the angle `theta` in degrees.
+
+    This is the same as cnum(r, theta), but without any dispatching or validation of the arguments, which makes it the fastest way of entering a complex number as a position vector in the polar complex plane.
+
+    Since the arguments are not validated, an infinite angle raises the ValueError of cmath.rect() ("math domain error").
+
+    Parameters
+    ----------
+    `r` : int | float
+        * The magnitude/modulus of the complex number.
+
+    `theta` : int | float
+        * The angle/argument of the complex number in degrees.
+
+    Returns
+    -------
+    complex
+        * The complex number in Python format which can be used in further calculations.
+
+    Examples
+    --------
+    >>> cnum = polar_deg(10, 180) # Same as cnum(10, 180).
+    """
+
+    u = _EXACT_DEG.get(theta % 360)
+    return r*u if u is not None else _rect(r, theta*_DEG2RAD)
+
+
+def polar_rad(r:int|float, theta:int|float) -> complex:
+    """Returns the complex number defined by the magnitude `r` and the angle `theta` in radians.
+
+    This is the same as cnum(r, theta, 'rad'), but without any dispatching or validation of the arguments, which makes it the fastest way of entering a complex number as a position vector in the polar complex plane.
+
+    Since the arguments are not validated, an infinite angle raises the ValueError of cmath.rect() ("math domain error").
+
+    Parameters
+    ----------
+    `r` : int | float
+        * The magnitude/modulus of the complex number.
+
+    `theta` : int | float
+        * The angle/argument of the complex number in radians.
+
+    Returns
+    -------
+    complex
+        * The complex number in Python format which can be used in further calculations.
+
+    Examples
+    --------
+    >>> cnum = polar_rad(10, 3.14) # Same as cnum(10, 3.14, 'rad').
+    """
+
+    return _rect(r, theta)
 
 
 def pol(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str='deg') -> str:
@@ -77,6 +252,8 @@ def pol(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str='deg'
     
     The number of decimals in the string can be defined using `dec`.
 
+    The angle is shown in the interval from -180° to 180°, where -180° is only shown for angles reaching the negative real axis clockwise (e.g. `pol(1, -180)`). A negative magnitude is shown as a positive magnitude with the angle rotated half a turn, and a zero magnitude always has the angle 0°.
+
     Parameters
     ----------
     `a` : int | float | complex
@@ -115,27 +292,37 @@ def pol(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str='deg'
     >>> string = pol(10, 3.14, 0, 'rad') # The complex number is entered as a position vector in the polar complex plane with the angle in radians and 0 decimals.
     """
 
-    # DEFINE THE MAGNITUDE AND ANGLE:
-    if isinstance(a, complex):
+    # DEFINE THE NUMBER OF DECIMALS:
+    if isinstance(a, complex) and b is not None:
         # The complex number is entered as a Cartesian polynomial, 
         # which means cnum() does not allow passing any argument to the second parameter.
-        mag = abs(a)
-        ang = phase(a)*(180/pi) # Angle in degrees.
-        if b is not None:
-            dec = b # Treat the second argument as the number of decimals.
+        dec = b # Treat the second argument as the number of decimals.
+    _check_dec(dec)
+
+    # DEFINE THE MAGNITUDE AND ANGLE:
+    if isinstance(a, complex):
+        # The complex number is entered as a Cartesian polynomial.
+        mag = _hypot(a.real, a.imag)
+        ang = _atan2(a.imag, a.real)*_RAD2DEG # Angle in degrees.
+    elif isinstance(a, (int, float)) and isinstance(b, complex):
+        # The complex number is entered as Cartesian coordinates, 
+        # which means the magnitude and angle can be found without the validation in cnum(). 
+        # The parts are still added as complex numbers so that signed zeros behave like in cnum(a, b).
+        z = a + b
+        mag = _hypot(z.real, z.imag)
+        ang = _atan2(z.imag, z.real)*_RAD2DEG # Angle in degrees.
+    elif isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        # The complex number is entered as a position vector in the polar complex plane, 
+        # which means it already is defined by its magnitude and angle.
+        mag, ang = _polar_parts(a, b, unit)
     else:
-        # The complex number is entered as either Cartesian coordinates or a position vector in the polar complex plane.
-        mag = abs(cnum(a, b, unit))
-        ang = phase(cnum(a, b, unit))*(180/pi) # Angle in degrees.
+        # The complex number is entered as a real polynomial (or the arguments are invalid, which cnum() reports).
+        z = cnum(a, b, unit)
+        mag = abs(z)
+        ang = phase(z)*_RAD2DEG # Angle in degrees.
     
     # RETURN THE COMPLEX NUMBER:
-    if isinstance(dec, int):
-        if dec >= 0:
-            return f"{mag:.{dec}f}{chr(8736)}{ang:.{dec}f}{chr(176)}"
-        else:
-            raise ValueError("The number of decimals must be defined with a positive integer.")
-    else:
-        raise TypeError("The number of decimals must be of type 'int'.")
+    return _POL_FMT % (dec, mag, dec, ang)
 
 
 def polprint(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str='deg'):
@@ -147,6 +334,8 @@ def polprint(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str=
     
     The number of decimals when printing can be defined using `dec`.
 
+    The angle is shown in the interval from -180° to 180°, where -180° is only shown for angles reaching the negative real axis clockwise (e.g. `pol(1, -180)`). A negative magnitude is shown as a positive magnitude with the angle rotated half a turn, and a zero magnitude always has the angle 0°.
+
     Parameters
     ----------
     `a` : int | float | complex
@@ -188,4 +377,11 @@ def polprint(a:int|float|complex, b:int|float|complex=None, dec:int=0, unit:str=
     """
 
     # PRINT THE COMPLEX NUMBER:
-    print(pol(a, b, dec, unit))
\ No newline at end of file
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        # The complex number is entered as a position vector in the polar complex plane, 
+        # which means its magnitude and angle can be written directly without going through pol() or cnum().
+        _check_dec(dec)
+        mag, ang = _polar_parts(a, b, unit)
+        _sys.stdout.write(_POL_FMT % (dec, mag, dec, ang) + '\n')
+    else:
+        print(pol(a, b, dec, unit))
\ No newline at end of file
@@ -3,7 +3,7 @@ from pathlib import Path
 
 setup(
     name='cmath_extras',
-    version='1.0.0',
+    version='1.1.0',
     description='A package of functions to deal with complex numbers in Python more efficiently.',
     long_description=(Path(__file__).parent / "README.md").read_text(),
     long_description_content_type='text/markdown',
@@ -26,5 +26,9 @@ setup(
         'imaginary numbers', 'electrical circuits',
         ],
     packages=find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+        'numba': ['numba'],
+        },
     python_requires='>=3'
 )
\ No newline at end of file
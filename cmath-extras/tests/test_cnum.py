@@ -0,0 +1,100 @@
+"""
+Regression tests for the complex numbers returned by cnum() and the other polar constructors.
+"""
+
+import cmath
+import math
+import re
+import unittest
+
+from cmath_extras import cnum, cnum_array, polar_deg, polar_rad
+
+try:
+    import numpy
+except ImportError: # The cnum_array() tests are skipped without NumPy.
+    numpy = None
+
+
+class TestExactAngles(unittest.TestCase):
+
+    def test_quarter_turns_are_exact(self):
+        self.assertEqual(cnum(10, 90), complex(0, 10))
+        self.assertEqual(cnum(10, 180), complex(-10, 0))
+        self.assertEqual(cnum(10, 270), complex(0, -10))
+
+    def test_wrapped_and_negative_angles_are_exact(self):
+        self.assertEqual(cnum(10, -90), complex(0, -10))
+        self.assertEqual(cnum(10, 450), complex(0, 10))
+        self.assertEqual(cnum(10, -0.0), complex(10, 0))
+        self.assertEqual(cnum(2, -330), complex(math.sqrt(3), 1))
+
+    def test_other_angles_match_rect(self):
+        self.assertEqual(cnum(10, 37), cmath.rect(10, math.radians(37)))
+        self.assertEqual(cnum(10, 37.5), cmath.rect(10, math.radians(37.5)))
+        self.assertEqual(cnum(2, 1, 'rad'), cmath.rect(2, 1))
+
+
+class TestPolarConstructors(unittest.TestCase):
+
+    def test_polar_deg_matches_cnum(self):
+        for theta in range(-720, 721, 15):
+            for r in (0, 2.5, -3):
+                with self.subTest(r=r, theta=theta):
+                    self.assertEqual(polar_deg(r, theta), cnum(r, theta))
+                    self.assertEqual(polar_deg(r, theta + 0.1), cnum(r, theta + 0.1, 'deg'))
+
+    def test_polar_rad_matches_cnum(self):
+        for i in range(-40, 41):
+            theta = i*math.pi/8
+            for r in (0, 2.5, -3):
+                with self.subTest(r=r, theta=theta):
+                    self.assertEqual(polar_rad(r, theta), cnum(r, theta, 'rad'))
+
+
+
+class TestInvalidAngles(unittest.TestCase):
+
+    def test_non_finite_angle_raises(self):
+        with self.assertRaisesRegex(ValueError, "The angle must be a finite number."):
+            cnum(1, float('inf'))
+        with self.assertRaisesRegex(ValueError, "The angle must be a finite number."):
+            cnum(1, float('-inf'), 'rad')
+        with self.assertRaisesRegex(ValueError, "The angle must be a finite number."):
+            cnum(1, float('nan'))
+
+
+
+@unittest.skipUnless(numpy is not None, "cnum_array() requires NumPy.")
+class TestCnumArray(unittest.TestCase):
+
+    # cnum_array() does not use the exact unit phasors, so it only matches cnum() up to rounding errors.
+    TOLERANCE = {'rtol': 0, 'atol': 1e-12}
+
+    def test_matches_cnum_in_degrees(self):
+        r = [1, 2.5, -3, 10, 7]
+        theta = [0, 37, 180, -90, 1000.5]
+        result = cnum_array(r, theta)
+        self.assertEqual(result.dtype, numpy.complex128)
+        numpy.testing.assert_allclose(result, [cnum(a, b) for a, b in zip(r, theta)], **self.TOLERANCE)
+
+    def test_matches_cnum_in_radians(self):
+        r = [1, 2.5, -3, 10, 7]
+        theta = [0, 0.5, math.pi, -math.pi/2, 12.3]
+        result = cnum_array(r, theta, 'rad')
+        numpy.testing.assert_allclose(result, [cnum(a, b, 'rad') for a, b in zip(r, theta)], **self.TOLERANCE)
+
+    def test_broadcasts_a_scalar_magnitude(self):
+        theta = numpy.linspace(-360, 360, 49)
+        result = cnum_array(10, theta)
+        self.assertEqual(result.shape, theta.shape)
+        numpy.testing.assert_allclose(result, [cnum(10, float(b)) for b in theta], **self.TOLERANCE)
+
+    def test_invalid_unit_raises_like_cnum(self):
+        with self.assertRaises(ValueError) as expected:
+            cnum(1, 2, 'grad')
+        with self.assertRaisesRegex(ValueError, re.escape(str(expected.exception))):
+            cnum_array([1], [2], 'grad')
+
+
+if __name__ == '__main__':
+    unittest.main()
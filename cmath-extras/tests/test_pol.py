@@ -0,0 +1,82 @@
+"""
+Regression tests for the polar angle notation returned by pol() and printed by polprint().
+"""
+
+import contextlib
+import io
+import unittest
+
+from cmath_extras import cnum, pol, polprint
+
+
+class TestPolarInput(unittest.TestCase):
+
+    def test_angle_is_normalized(self):
+        self.assertEqual(pol(10, 190, 1), '10.0∠-170.0°')
+        self.assertEqual(pol(10, 720), '10∠0°')
+        self.assertEqual(pol(2, -0.0), '2∠0°')
+        # Large angles are reduced exactly: 1e17 = 280 (mod 360) and 7.2e16 + 90 = 88 (mod 360).
+        self.assertEqual(pol(1, 1e17, 3), '1.000∠-80.000°')
+        self.assertEqual(pol(-1, 1e17, 3), '1.000∠100.000°')
+        self.assertEqual(pol(1, 7.2e16+90), '1∠88°')
+
+    def test_half_turn_keeps_the_direction_of_rotation(self):
+        # Like atan2(), -180 is only returned for angles reaching the negative real axis clockwise.
+        self.assertEqual(pol(1, 180), '1∠180°')
+        self.assertEqual(pol(1, -180), '1∠-180°')
+        self.assertEqual(pol(1, 540), '1∠180°')
+        self.assertEqual(pol(1, -540), '1∠-180°')
+        self.assertEqual(pol(1, -3.141592653589793, 0, 'rad'), '1∠-180°')
+
+    def test_negative_magnitude_rotates_half_a_turn(self):
+        self.assertEqual(pol(-10, 30, 2), '10.00∠-150.00°')
+        self.assertEqual(pol(-1, 0), '1∠180°')
+        self.assertEqual(pol(-1, -360), '1∠-180°')
+
+    def test_zero_magnitude_has_zero_angle(self):
+        self.assertEqual(pol(0, 45), '0∠0°')
+        self.assertEqual(pol(-0.0, 10), '0∠0°')
+        self.assertEqual(pol(0, 45), pol(0, 0j))
+
+    def test_non_finite_angle_raises(self):
+        for args in ((1, float('inf')), (0, float('inf')), (1, float('-inf'), 0, 'rad'), (1, float('nan'))):
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(ValueError, "The angle must be a finite number."):
+                    pol(*args)
+                with self.assertRaisesRegex(ValueError, "The angle must be a finite number."):
+                    polprint(*args)
+
+    def test_matches_cartesian_input(self):
+        for theta in (-179, -135, -90, -37.5, 0, 12.3, 60, 90, 135, 179):
+            with self.subTest(theta=theta):
+                z = cnum(3, theta)
+                self.assertEqual(pol(3, theta, 6), pol(z, 6))
+                self.assertEqual(pol(3, theta, 6), pol(z.real, z.imag*1j, 6))
+
+
+class TestCartesianInput(unittest.TestCase):
+
+    def test_matches_cnum(self):
+        for args in ((2, 3j), (2, 1+3j), (-1, -0j), (1, -0j), (-1, 0j)):
+            with self.subTest(args=args):
+                self.assertEqual(pol(*args, 3), pol(cnum(*args), 3))
+
+    def test_negative_zero_imaginary_part(self):
+        self.assertEqual(pol(-1, -0j), '1∠180°')
+        self.assertEqual(pol(1, -0j), '1∠0°')
+        self.assertEqual(pol(complex(-1, -0.0)), '1∠-180°')
+
+
+class TestPolprint(unittest.TestCase):
+
+    def test_writes_the_same_string_as_pol(self):
+        for args in ((1, -180), (0, 45), (-10, 30, 2), (10, 3.14, 0, 'rad'), (2, 3j, 1), (2+3j, 1)):
+            with self.subTest(args=args):
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    polprint(*args)
+                self.assertEqual(out.getvalue(), pol(*args) + '\n')
+
+
+if __name__ == '__main__':
+    unittest.main()